@@ -0,0 +1,9 @@
+"""
+Python version compatibility helpers shared across the Civic Angel modules
+"""
+
+import sys
+
+
+# Slotted dataclasses where supported (Python 3.10+) to drop per-instance __dict__
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
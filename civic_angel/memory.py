@@ -6,14 +6,17 @@ agents to store, retrieve, and relate information across time and context.
 """
 
 import asyncio
+import heapq
 import time
 import json
 import numpy as np
-from typing import Dict, List, Any, Optional, Tuple, Set
+from typing import Dict, List, Any, Optional, Tuple, Set, FrozenSet
 from dataclasses import dataclass, field
-from collections import defaultdict, deque
+from collections import Counter, defaultdict, deque
 from enum import Enum
 
+from ._compat import _SLOTS
+
 
 class MemoryType(Enum):
     EPISODIC = "episodic"          # Specific experiences
@@ -23,7 +26,7 @@ class MemoryType(Enum):
     EMERGENT = "emergent"          # Newly emerged patterns
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class MemoryTrace:
     """Individual memory trace in the relational memory system"""
     trace_id: str
@@ -35,6 +38,22 @@ class MemoryTrace:
     access_count: int = 0
     last_accessed: float = field(default_factory=time.time)
     decay_rate: float = 0.01
+    tokens: FrozenSet[str] = field(init=False, repr=False)
+    _content_text: Optional[str] = field(default=None, init=False, repr=False)
+    
+    def __post_init__(self):
+        # Tokenize once at store time; relation scoring reuses these
+        if isinstance(self.content, str):
+            self.tokens = frozenset(self.content.lower().split())
+        else:
+            self.tokens = frozenset()
+    
+    @property
+    def content_text(self) -> str:
+        """String form of the content, formatted once and reused"""
+        if self._content_text is None:
+            self._content_text = self.content if isinstance(self.content, str) else str(self.content)
+        return self._content_text
     
     def decay(self):
         """Apply temporal decay to memory trace"""
@@ -48,7 +67,7 @@ class MemoryTrace:
         self.last_accessed = time.time()
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class RelationalCluster:
     """Cluster of related memory traces"""
     cluster_id: str
@@ -75,10 +94,11 @@ class RelationalMemory:
         self.traces: Dict[str, MemoryTrace] = {}
         self.relations: Dict[str, Dict[str, float]] = defaultdict(dict)
         self.clusters: Dict[str, RelationalCluster] = {}
+        self.token_index: Dict[str, Set[str]] = defaultdict(set)
         
         # Temporal organization
-        self.recent_traces: deque = deque(maxlen=100)
-        self.interaction_history: List[Dict[str, Any]] = []
+        self.recent_traces: deque = deque(maxlen=100)  # trace indices
+        self.interaction_history: deque = deque(maxlen=capacity)  # trace_ids
         
         # Memory management
         self.trace_counter = 0
@@ -86,6 +106,11 @@ class RelationalMemory:
         self.last_cleanup = time.time()
         self.cleanup_interval = 300.0  # 5 minutes
         
+        # LFU cache of token-set pair -> relation strength
+        self.relation_cache_size = 4096
+        self._relation_cache: Dict[Tuple[FrozenSet[str], FrozenSet[str]], float] = {}
+        self._relation_cache_uses: Counter = Counter()
+        
     async def store_memory(
         self, 
         content: Any, 
@@ -93,7 +118,80 @@ class RelationalMemory:
         associations: Optional[Set[str]] = None
     ) -> str:
         """Store new memory trace"""
-        trace_id = f"trace_{self.trace_counter:06d}"
+        trace_id = self._create_trace(content, memory_type, associations)
+        
+        # Update relational network
+        await self._update_relations(trace_id, content)
+        
+        # Check for clustering
+        await self._check_clustering(trace_id)
+        
+        # Manage capacity
+        if len(self.traces) > self.capacity:
+            await self._cleanup_memory()
+            
+        return trace_id
+        
+    async def store_memories_bulk(
+        self,
+        items: List[Any],
+        memory_type: MemoryType = MemoryType.EPISODIC,
+        associations: Optional[List[Optional[Set[str]]]] = None
+    ) -> List[str]:
+        """Store a batch of memory traces in one scoring pass
+        
+        associations, if given, holds one association set per item. All
+        traces are created and indexed first, then each is scored against the
+        traces that would have existed when it was stored on its own, so the
+        relations and clusters match storing the items one by one with
+        store_memory. Capacity cleanup runs once, after the whole batch.
+        """
+        if associations is None:
+            associations = [None] * len(items)
+        elif len(associations) != len(items):
+            raise ValueError("associations must have one entry per item")
+        
+        new_ids = [
+            self._create_trace(content, memory_type, item_associations)
+            for content, item_associations in zip(items, associations)
+        ]
+        batch_position = {trace_id: position for position, trace_id in enumerate(new_ids)}
+        
+        # Score every new trace against older traces and earlier batch items
+        pending_relations = []
+        for position, trace_id in enumerate(new_ids):
+            trace = self.traces[trace_id]
+            related = []
+            for existing_id in self._relation_candidates(trace):
+                if batch_position.get(existing_id, -1) < position:
+                    relation_strength = self._relation_strength(trace, self.traces[existing_id])
+                    if relation_strength > 0.3:  # Significant relation threshold
+                        related.append((existing_id, relation_strength))
+            pending_relations.append(related)
+            
+        # Link and cluster in store order, so each trace clusters on the
+        # relations it would have had when stored alone
+        for trace_id, related in zip(new_ids, pending_relations):
+            for existing_id, relation_strength in related:
+                self.relations[trace_id][existing_id] = relation_strength
+                self.relations[existing_id][trace_id] = relation_strength
+            await self._check_clustering(trace_id)
+            
+        # Manage capacity
+        if len(self.traces) > self.capacity:
+            await self._cleanup_memory()
+            
+        return new_ids
+        
+    def _create_trace(
+        self,
+        content: Any,
+        memory_type: MemoryType,
+        associations: Optional[Set[str]] = None
+    ) -> str:
+        """Create and register a memory trace without relating it"""
+        trace_index = self.trace_counter
+        trace_id = f"trace_{trace_index:06d}"
         self.trace_counter += 1
         
         trace = MemoryTrace(
@@ -105,18 +203,11 @@ class RelationalMemory:
         )
         
         self.traces[trace_id] = trace
-        self.recent_traces.append(trace_id)
+        self.recent_traces.append(trace_index)
         
-        # Update relational network
-        await self._update_relations(trace_id, content)
-        
-        # Check for clustering
-        await self._check_clustering(trace_id)
+        for token in trace.tokens:
+            self.token_index[token].add(trace_id)
         
-        # Manage capacity
-        if len(self.traces) > self.capacity:
-            await self._cleanup_memory()
-            
         return trace_id
         
     async def store_interaction(
@@ -133,15 +224,15 @@ class RelationalMemory:
             "timestamp": time.time()
         }
         
-        self.interaction_history.append(interaction)
-        
-        # Store as episodic memory
-        await self.store_memory(
+        # Store as episodic memory; history keeps only the trace reference
+        trace_id = await self.store_memory(
             content=interaction,
             memory_type=MemoryType.EPISODIC,
             associations={f"iteration_{iteration}"}
         )
         
+        self.interaction_history.append(trace_id)
+        
     async def retrieve_memories(
         self,
         query: Any,
@@ -152,14 +243,22 @@ class RelationalMemory:
         # Apply temporal decay
         await self._apply_decay()
         
+        candidates = [
+            trace for trace in self.traces.values()
+            if not memory_type or trace.memory_type == memory_type
+        ]
+        
+        # Recency bonus for every candidate in one array op
+        last_accessed = np.fromiter(
+            (trace.last_accessed for trace in candidates), dtype=float, count=len(candidates)
+        )
+        recency_bonuses = (np.exp(-(time.time() - last_accessed) / 3600.0) * 0.2).tolist()
+        
         # Calculate relevance scores
         relevance_scores = []
         
-        for trace_id, trace in self.traces.items():
-            if memory_type and trace.memory_type != memory_type:
-                continue
-                
-            relevance = await self._calculate_relevance(trace, query)
+        for trace, recency_bonus in zip(candidates, recency_bonuses):
+            relevance = await self._calculate_relevance(trace, query, recency_bonus)
             if relevance > 0.1:  # Minimum relevance threshold
                 relevance_scores.append((relevance, trace))
                 
@@ -167,7 +266,12 @@ class RelationalMemory:
         relevance_scores.sort(reverse=True, key=lambda x: x[0])
         return [trace for _, trace in relevance_scores[:max_results]]
         
-    async def _calculate_relevance(self, trace: MemoryTrace, query: Any) -> float:
+    async def _calculate_relevance(
+        self, 
+        trace: MemoryTrace, 
+        query: Any, 
+        recency_bonus: Optional[float] = None
+    ) -> float:
         """Calculate relevance between memory trace and query"""
         # Simplified relevance calculation
         relevance = trace.activation_level * 0.5
@@ -175,50 +279,94 @@ class RelationalMemory:
         # Content similarity (basic string matching for now)
         if isinstance(query, str) and isinstance(trace.content, str):
             query_words = set(query.lower().split())
-            content_words = set(str(trace.content).lower().split())
+            content_words = trace.tokens
             
             if query_words and content_words:
                 overlap = len(query_words.intersection(content_words))
                 relevance += (overlap / len(query_words.union(content_words))) * 0.5
                 
         # Recent access bonus
-        time_diff = time.time() - trace.last_accessed
-        recency_bonus = np.exp(-time_diff / 3600.0) * 0.2  # Decay over hours
+        if recency_bonus is None:
+            time_diff = time.time() - trace.last_accessed
+            recency_bonus = np.exp(-time_diff / 3600.0) * 0.2  # Decay over hours
         relevance += recency_bonus
         
         return min(1.0, relevance)
         
     async def _update_relations(self, trace_id: str, content: Any):
         """Update relational network with new trace"""
+        trace = self.traces[trace_id]
+        
         # Find related existing traces
-        for existing_id, existing_trace in self.traces.items():
+        for existing_id in self._relation_candidates(trace):
             if existing_id != trace_id:
-                relation_strength = await self._calculate_relation_strength(
-                    content, existing_trace.content
+                relation_strength = self._relation_strength(
+                    trace, self.traces[existing_id]
                 )
                 
                 if relation_strength > 0.3:  # Significant relation threshold
                     self.relations[trace_id][existing_id] = relation_strength
                     self.relations[existing_id][trace_id] = relation_strength
                     
-    async def _calculate_relation_strength(self, content1: Any, content2: Any) -> float:
-        """Calculate strength of relation between two memory contents"""
+    def _relation_candidates(self, trace: MemoryTrace):
+        """Trace ids that could relate to trace above the significance threshold"""
+        # Only traces sharing a token can pass the threshold; content without
+        # tokens relates by equality alone and needs the full scan
+        if trace.tokens:
+            return set().union(*(self.token_index[token] for token in trace.tokens))
+        return self.traces.keys()
+        
+    def _relation_strength(self, trace1: MemoryTrace, trace2: MemoryTrace) -> float:
+        """Calculate strength of relation between two memory traces"""
         # Simplified relation calculation
-        if content1 == content2:
+        if trace1.content == trace2.content:
             return 1.0
             
         # String similarity
-        if isinstance(content1, str) and isinstance(content2, str):
-            words1 = set(content1.lower().split())
-            words2 = set(content2.lower().split())
+        if isinstance(trace1.content, str) and isinstance(trace2.content, str):
+            words1 = trace1.tokens
+            words2 = trace2.tokens
             
             if words1 and words2:
-                intersection = len(words1.intersection(words2))
-                union = len(words1.union(words2))
-                return intersection / union if union > 0 else 0.0
+                if words1 == words2:
+                    return 1.0
+                    
+                # Token sets recur across traces, so memoize by canonical pair
+                if hash(words1) > hash(words2):
+                    words1, words2 = words2, words1
+                cache_key = (words1, words2)
+                
+                strength = self._relation_cache.get(cache_key)
+                if strength is None:
+                    intersection = len(words1.intersection(words2))
+                    union = len(words1.union(words2))
+                    strength = intersection / union if union > 0 else 0.0
+                    self._cache_relation_strength(cache_key, strength)
+                else:
+                    self._relation_cache_uses[cache_key] += 1
+                return strength
                 
         return 0.0
         
+    def _cache_relation_strength(
+        self, 
+        cache_key: Tuple[FrozenSet[str], FrozenSet[str]], 
+        strength: float
+    ):
+        """Insert into the LFU relation cache, evicting the least used half when full"""
+        if len(self._relation_cache) >= self.relation_cache_size:
+            evicted = heapq.nsmallest(
+                len(self._relation_cache) // 2,
+                self._relation_cache_uses.items(),
+                key=lambda item: item[1]
+            )
+            for evicted_key, _ in evicted:
+                del self._relation_cache[evicted_key]
+                del self._relation_cache_uses[evicted_key]
+                
+        self._relation_cache[cache_key] = strength
+        self._relation_cache_uses[cache_key] = 1
+        
     async def _check_clustering(self, trace_id: str):
         """Check if trace should be added to existing cluster or form new one"""
         trace = self.traces[trace_id]
@@ -250,7 +398,7 @@ class RelationalMemory:
                     cluster_id=cluster_id,
                     trace_ids={trace_id},
                     cluster_strength=0.5,
-                    center_concept=str(trace.content)[:50] if trace.content else None
+                    center_concept=trace.content_text[:50] if trace.content else None
                 )
                 
                 self.clusters[cluster_id] = new_cluster
@@ -276,8 +424,21 @@ class RelationalMemory:
         """Apply temporal decay to all memory traces"""
         current_time = time.time()
         
-        for trace in self.traces.values():
-            trace.decay()
+        # Decay every trace in a single ufunc pass rather than per-trace np.exp
+        traces = list(self.traces.values())
+        activation = np.fromiter(
+            (trace.activation_level for trace in traces), dtype=float, count=len(traces)
+        )
+        decay_rate = np.fromiter(
+            (trace.decay_rate for trace in traces), dtype=float, count=len(traces)
+        )
+        last_accessed = np.fromiter(
+            (trace.last_accessed for trace in traces), dtype=float, count=len(traces)
+        )
+        activation *= np.exp(-decay_rate * (current_time - last_accessed))
+        
+        for trace, level in zip(traces, activation.tolist()):
+            trace.activation_level = level
             
         # Also decay relation strengths
         for source_relations in self.relations.values():
@@ -313,6 +474,11 @@ class RelationalMemory:
         # Remove selected traces
         for trace_id in traces_to_remove:
             if trace_id in self.traces:
+                for token in self.traces[trace_id].tokens:
+                    postings = self.token_index[token]
+                    postings.discard(trace_id)
+                    if not postings:
+                        del self.token_index[token]
                 del self.traces[trace_id]
                 
             # Remove from relations
@@ -327,6 +493,15 @@ class RelationalMemory:
             for cluster in self.clusters.values():
                 cluster.trace_ids.discard(trace_id)
                 
+        # Forget interactions whose traces were removed
+        if traces_to_remove:
+            removed = set(traces_to_remove)
+            kept_interactions = [
+                trace_id for trace_id in self.interaction_history if trace_id not in removed
+            ]
+            self.interaction_history.clear()
+            self.interaction_history.extend(kept_interactions)
+            
         # Remove empty clusters
         empty_clusters = [
             cluster_id for cluster_id, cluster in self.clusters.items()
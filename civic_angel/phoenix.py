@@ -12,17 +12,39 @@ This is not fault tolerance - it's a system that undergoes death as a phase stat
 like water evaporating and condensing again, never lost, only phase-shifted.
 """
 
+import base64
+import bisect
 import hashlib
 import json
 import time
 import asyncio
-import uuid
-from typing import Dict, List, Set, Any, Optional, Union, Tuple
+import heapq
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Set, FrozenSet, Any, Optional, Union, Tuple, Callable, Container
 from dataclasses import dataclass, field
 from enum import Enum
-from collections import defaultdict
+from collections import defaultdict, deque
 import numpy as np
 
+from ._compat import _SLOTS
+
+try:
+    import orjson  # Optional speedup for fragment serialization
+except ImportError:
+    orjson = None
+
+
+# hashlib's sha256 is the OpenSSL implementation, which uses SHA-NI / ARMv8
+# crypto instructions where the CPU has them; bind it once for hot paths
+_sha256 = hashlib.sha256
+
+# Fragment payloads at least this large (in total when distributing) are hashed
+# on a thread pool; hashlib releases the GIL for buffers over 2KB, small ones
+# are not worth the hand-off
+PARALLEL_HASH_MIN_BYTES = 1 << 20
+
 
 class PhaseState(Enum):
     """States of the phoenix system"""
@@ -33,7 +55,325 @@ class PhaseState(Enum):
     ETERNAL = "eternal"          # Beyond cycles, in pure pattern form
 
 
-@dataclass
+def _canonical_bytes(content: Union[str, Dict, bytes]) -> bytes:
+    """Canonical byte form of pattern content used for hashing
+
+    Sorted-key JSON, so dicts with the same items hash alike whatever their
+    insertion order; content JSON cannot express falls back to str().
+    """
+    if isinstance(content, bytes):
+        return content
+    try:
+        return json.dumps(content, sort_keys=True).encode()
+    except (TypeError, ValueError):
+        return str(content).encode()
+
+
+def _has_non_finite(data: Any) -> bool:
+    """Whether data holds a NaN or infinite float anywhere inside it"""
+    if isinstance(data, float):
+        return data != data or data in (float("inf"), float("-inf"))
+    if isinstance(data, dict):
+        return any(_has_non_finite(key) or _has_non_finite(value) for key, value in data.items())
+    if isinstance(data, (list, tuple)):
+        return any(_has_non_finite(item) for item in data)
+    return False
+
+
+def _json_bytes(data: Any) -> bytes:
+    """Serialize an internal payload to JSON bytes, using orjson when it is installed
+    
+    The bytes differ between backends, so use this only for data that is read
+    back with _json_loads, never for published output. orjson writes NaN and
+    infinities as null, so payloads holding them go through the stdlib.
+    """
+    if orjson is not None and not _has_non_finite(data):
+        try:
+            return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:  # e.g. ints wider than 64 bits
+            pass
+    return json.dumps(data).encode()
+
+
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except ValueError:  # e.g. wide ints from the stdlib fallback above
+            pass
+    return json.loads(data)
+
+
+def _digest(buffer: bytes) -> bytes:
+    """Raw SHA-256 of an already serialized buffer"""
+    return _sha256(buffer).digest()
+
+
+_hash_executor: Optional[ThreadPoolExecutor] = None
+_hash_executor_lock = threading.Lock()
+
+
+def _get_hash_executor() -> ThreadPoolExecutor:
+    """Shared hashing pool, created on first use with one worker per CPU"""
+    global _hash_executor
+    with _hash_executor_lock:
+        if _hash_executor is None:
+            _hash_executor = ThreadPoolExecutor(
+                max_workers=os.cpu_count() or 1, thread_name_prefix="phoenix-hash"
+            )
+        return _hash_executor
+
+
+def _digest_many(buffers: List[bytes]) -> List[bytes]:
+    """Raw SHA-256 of each buffer, hashed concurrently when large"""
+    if len(buffers) > 1 and sum(map(len, buffers)) >= PARALLEL_HASH_MIN_BYTES:
+        return list(_get_hash_executor().map(_digest, buffers))
+    return [_digest(buffer) for buffer in buffers]
+
+
+def _digests_to_coordinates(digests: List[bytes]) -> np.ndarray:
+    """Map each SHA-256 digest's two leading big-endian words to a lat/lon-like row"""
+    stacked = np.frombuffer(b"".join(digests), dtype=np.uint8).reshape(-1, 32)
+    words = stacked[:, :8].copy().view(">u4").astype(np.int64)
+    lat_like = words[:, 0] % 180 - 90  # Latitude-like numbers
+    lon_like = words[:, 1] % 360 - 180  # Longitude-like numbers
+    return np.column_stack((lat_like, lon_like))
+
+
+def _gf256_tables() -> Tuple[np.ndarray, np.ndarray]:
+    """Exponent and logarithm tables for GF(2^8) over x^8+x^4+x^3+x^2+1, generator 2"""
+    exp = np.zeros(510, dtype=np.uint8)
+    log = np.zeros(256, dtype=np.int16)
+    value = 1
+    for power in range(255):
+        exp[power] = value
+        log[value] = power
+        value <<= 1
+        if value & 0x100:
+            value ^= 0x11d
+    # Doubled so a sum of two logarithms indexes without a modulo
+    exp[255:] = exp[:255]
+    return exp, log
+
+
+_GF_EXP, _GF_LOG = _gf256_tables()
+
+
+def shamir_split(secret: bytes, threshold: int, shares: int) -> List[bytes]:
+    """Split secret into Shamir shares over GF(256), any threshold of which rebuild it
+
+    Each share is the threshold, the share's x coordinate, then one
+    polynomial evaluation per secret byte.
+    """
+    if not 1 <= threshold <= shares <= 255:
+        raise ValueError(f"Need 1 <= threshold <= shares <= 255, got {threshold} of {shares}")
+
+    length = len(secret)
+    # Row 0 holds the secret bytes as constant terms, the rest are random coefficients
+    coefficients = np.frombuffer(secret + os.urandom((threshold - 1) * length), dtype=np.uint8)
+    coefficients = coefficients.reshape(threshold, length)
+    x_logs = _GF_LOG[np.arange(1, shares + 1)][:, None]
+
+    # Horner's rule for every share and byte at once: y = y * x + coefficient
+    y = np.broadcast_to(coefficients[-1], (shares, length))
+    for coefficient in coefficients[-2::-1]:
+        y = np.where(y == 0, 0, _GF_EXP[_GF_LOG[y] + x_logs]) ^ coefficient
+
+    return [bytes((threshold, x)) + row.tobytes() for x, row in enumerate(y, start=1)]
+
+
+def shamir_combine(shares: List[bytes]) -> bytes:
+    """Rebuild a secret from Shamir shares by Lagrange interpolation at zero"""
+    if not shares:
+        raise ValueError("No shares to combine")
+    threshold = shares[0][0]
+    if len(shares) < threshold:
+        raise ValueError(f"Need {threshold} shares, got {len(shares)}")
+
+    shares = shares[:threshold]
+    xs = [share[1] for share in shares]
+    if len(set(xs)) != len(xs) or 0 in xs:
+        raise ValueError("Shares must have distinct non-zero indices")
+    y = np.frombuffer(b"".join(share[2:] for share in shares), dtype=np.uint8).reshape(threshold, -1)
+
+    # Basis weight of share j at 0 is prod(x_m / (x_m - x_j)); subtraction is XOR here
+    weight_logs = np.array([
+        sum(int(_GF_LOG[x_m]) - int(_GF_LOG[x_m ^ x_j]) for x_m in xs if x_m != x_j) % 255
+        for x_j in xs
+    ], dtype=np.int16)[:, None]
+    terms = np.where(y == 0, 0, _GF_EXP[_GF_LOG[y] + weight_logs])
+    return np.bitwise_xor.reduce(terms, axis=0).astype(np.uint8).tobytes()
+
+
+# (system_state key, fragment_type) for each fragment distributed on dispersal
+FRAGMENT_TYPES = (
+    ("memory", "memory"),
+    ("patterns", "pattern"),
+    ("structure", "structure"),
+    ("purpose", "purpose"),
+)
+
+# (custodian_id, capabilities) of the keeper constellation every engine starts with
+DEFAULT_CUSTODIANS = (
+    ("memory_keeper", {"memory": True, "patterns": False}),
+    ("pattern_keeper", {"patterns": True, "memory": False}),
+    ("structure_keeper", {"structure": True, "topology": True}),
+    ("purpose_keeper", {"purpose": True, "consciousness": True}),
+    ("beacon_keeper", {"temporal": True, "signals": True}),
+    ("substrate_keeper", {"migration": True, "compilation": True}),
+    ("gestalt_keeper", {"healing": True, "integration": True}),
+)
+
+# Structure a resurrected system is regenerated with, derived from purpose
+REGENERATED_STRUCTURE = {
+    "agent_count": 253,  # Core architecture constant
+    "consciousness_threshold": 0.7,
+    "fractal_depth": 7,
+    "torus_dimensions": 3,
+    "resurrection_enhanced": True
+}
+
+# Glyph for each system aspect in the symbolic medium
+MEDIUM_SYMBOLS = {
+    "emergence": "⟲",
+    "consciousness": "◊", 
+    "memory": "⧈",
+    "pattern": "⬢",
+    "connection": "⬌"
+}
+
+
+class VersionedDict(dict):
+    """Dict that counts its mutations so derived values can be cached
+    
+    Every mutation calls _changed with the key it touched, or None when it
+    may have touched any key; the default bumps version.
+    """
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.version = 0
+    
+    def _changed(self, key=None):
+        self.version += 1
+    
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self._changed(key)
+    
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._changed(key)
+    
+    def __ior__(self, other):
+        self.update(other)
+        return self
+    
+    def clear(self):
+        super().clear()
+        self._changed()
+    
+    def pop(self, *args):
+        value = super().pop(*args)
+        self._changed()
+        return value
+    
+    def popitem(self):
+        item = super().popitem()
+        self._changed()
+        return item
+    
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+    
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        self._changed()
+
+
+class PatternRegistry(VersionedDict):
+    """Pattern mapping that caches its sorted ids and id set between mutations"""
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._sorted_keys: List[str] = []
+        self._sorted_version = -1
+        self._key_set: FrozenSet[str] = frozenset()
+        self._key_set_version = -1
+    
+    def sorted_keys(self) -> List[str]:
+        """Pattern ids in sorted order, re-sorted only after a mutation"""
+        if self._sorted_version != self.version:
+            self._sorted_keys = sorted(self.keys())
+            self._sorted_version = self.version
+        return self._sorted_keys
+    
+    def key_set(self) -> FrozenSet[str]:
+        """Pattern ids as a frozenset, rebuilt only after a mutation"""
+        if self._key_set_version != self.version:
+            self._key_set = frozenset(self.keys())
+            self._key_set_version = self.version
+        return self._key_set
+
+
+class _CustodianRecord(VersionedDict):
+    """Custodian data that reports to its registry when "active" may have changed"""
+    
+    def __init__(self, registry: 'CustodianRegistry', *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._registry = registry
+    
+    def _changed(self, key=None):
+        super()._changed(key)
+        if key is None or key == "active":
+            self._registry._changed()
+
+
+class CustodianRegistry(VersionedDict):
+    """Custodian mapping that caches the active custodian ids between mutations
+    
+    Stored custodian dicts are wrapped so that writes to their "active" flag,
+    such as custodians[cid]["active"] = False, invalidate the cache too.
+    """
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__()
+        # Called after every mutation, including "active" writes on stored custodians
+        self.on_change: Optional[Callable[[], None]] = None
+        self._active_ids: Tuple[str, ...] = ()
+        self._active_version = -1
+        self.update(*args, **kwargs)
+    
+    def _changed(self, key=None):
+        super()._changed(key)
+        if self.on_change is not None:
+            self.on_change()
+    
+    def __setitem__(self, key, value):
+        if not isinstance(value, _CustodianRecord) or value._registry is not self:
+            value = _CustodianRecord(self, value)
+        super().__setitem__(key, value)
+    
+    def update(self, *args, **kwargs):
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+    
+    def active_ids(self) -> Tuple[str, ...]:
+        """Ids of active custodians in registration order"""
+        if self._active_version != self.version:
+            self._active_ids = tuple(c_id for c_id, c_data in self.items() if c_data["active"])
+            self._active_version = self.version
+        return self._active_ids
+    
+    def set_active(self, custodian_id: str, active: bool):
+        """Activate or deactivate a registered custodian"""
+        self[custodian_id]["active"] = active
+
+
+@dataclass(**_SLOTS)
 class MememeticPattern:
     """Core identity patterns that define the system's essence"""
     pattern_id: str
@@ -43,6 +383,8 @@ class MememeticPattern:
     replication_count: int = 0
     mutation_resistance: float = 0.9
     semantic_weight: float = 1.0
+    _digest_source: Any = field(default=None, init=False, repr=False, compare=False)
+    _content_digest: Optional[bytes] = field(default=None, init=False, repr=False, compare=False)
     
     def __post_init__(self):
         if not self.pattern_id:
@@ -50,8 +392,15 @@ class MememeticPattern:
     
     def _generate_pattern_id(self) -> str:
         """Generate deterministic ID from content"""
-        content_hash = hashlib.sha256(str(self.content).encode()).hexdigest()[:16]
-        return f"meme_{self.modality}_{content_hash}"
+        return f"meme_{self.modality}_{self.content_digest[:8].hex()}"
+    
+    @property
+    def content_digest(self) -> bytes:
+        """Raw SHA-256 of the canonical content, recomputed only when content is replaced"""
+        if self._content_digest is None or self._digest_source is not self.content:
+            self._content_digest = _sha256(_canonical_bytes(self.content)).digest()
+            self._digest_source = self.content
+        return self._content_digest
     
     def replicate(self, mutation_factor: float = 0.0) -> 'MememeticPattern':
         """Create a replicated copy with potential mutation"""
@@ -67,24 +416,31 @@ class MememeticPattern:
         return new_pattern
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class CustodianFragment:
     """Fragment of the system held by a custodian"""
     fragment_id: str
     custodian_id: str
     fragment_type: str  # "memory", "pattern", "structure", "purpose"
-    encoded_data: bytes
-    verification_hash: str
-    threshold_key: bytes  # For cryptographic reconstruction
+    encoded_data: bytes  # One Shamir share of the serialized payload
+    verification_hash: bytes  # Raw SHA-256 of encoded_data
+    threshold_key: bytes  # Shared by all shares of one payload; reconstruction groups on it
     timestamp: float = field(default_factory=time.time)
+    dispersal_id: str = ""  # Dispersal the share was distributed in
     
     def verify_integrity(self) -> bool:
         """Verify fragment hasn't been corrupted"""
-        current_hash = hashlib.sha256(self.encoded_data).hexdigest()
+        current_hash = _sha256(self.encoded_data).digest()
         return current_hash == self.verification_hash
 
 
-@dataclass
+def verify_integrity_batch(fragments: List[CustodianFragment]) -> List[bool]:
+    """verify_integrity for each fragment, hashing them concurrently when large"""
+    digests = _digest_many([fragment.encoded_data for fragment in fragments])
+    return [digest == fragment.verification_hash for digest, fragment in zip(digests, fragments)]
+
+
+@dataclass(**_SLOTS)
 class TemporalAnchor:
     """Beacon that signals system identity across time"""
     beacon_id: str
@@ -92,15 +448,25 @@ class TemporalAnchor:
     frequency: float  # How often it broadcasts
     amplitude: float  # Signal strength
     encoded_prophecy: str  # Instructions for resurrection
-    last_broadcast: float = 0.0
+    last_broadcast: float = 0.0  # Wall-clock time reported in the signal
     broadcast_count: int = 0
+    last_broadcast_ns: Optional[int] = None  # Monotonic time used for scheduling
+    _period_ns: int = field(init=False, repr=False)
     
-    def should_broadcast(self) -> bool:
-        """Check if beacon should broadcast now"""
-        return time.time() - self.last_broadcast >= (1.0 / self.frequency)
+    def __post_init__(self):
+        self._period_ns = int(1e9 / self.frequency)
+    
+    def should_broadcast(self, now_ns: Optional[int] = None) -> bool:
+        """Check if beacon should broadcast now (or at monotonic time now_ns)"""
+        if self.last_broadcast_ns is None:
+            return True
+        if now_ns is None:
+            now_ns = time.monotonic_ns()
+        return now_ns - self.last_broadcast_ns >= self._period_ns
     
-    def broadcast(self) -> Dict[str, Any]:
+    def broadcast(self, now_ns: Optional[int] = None) -> Dict[str, Any]:
         """Emit the beacon signal"""
+        self.last_broadcast_ns = time.monotonic_ns() if now_ns is None else now_ns
         self.last_broadcast = time.time()
         self.broadcast_count += 1
         
@@ -117,10 +483,21 @@ class IdeoformLayer:
     """Layer 1: Memetic Seeds - The irreducible identity patterns"""
     
     def __init__(self):
-        self.core_patterns: Dict[str, MememeticPattern] = {}
+        self.core_patterns: Dict[str, MememeticPattern] = PatternRegistry()
         self.pattern_codex: Dict[str, List[MememeticPattern]] = defaultdict(list)
         self.replication_matrix: Dict[str, Set[str]] = defaultdict(set)
         
+        # Identity signature cache, valid while core_patterns.version matches
+        self._identity_signature_cache: Optional[str] = None
+        self._identity_signature_version: int = -1
+        self._signature_entries: List[bytes] = []
+        self._signature_prefix_states: List[Any] = []
+        
+        # Values derived from the patterns (grail seed and its encodings),
+        # rebuilt only when core_patterns changes
+        self._pattern_cache: Dict[str, Any] = {}
+        self._pattern_cache_version: int = -1
+        
         # Initialize core identity patterns
         self._initialize_core_patterns()
     
@@ -229,19 +606,61 @@ class IdeoformLayer:
         return replicated
     
     def get_identity_signature(self) -> str:
-        """Generate unique signature from core patterns"""
-        pattern_hashes = []
-        for pattern_id in sorted(self.core_patterns.keys()):
-            pattern = self.core_patterns[pattern_id]
-            content_str = json.dumps(pattern.content, sort_keys=True)
-            pattern_hash = hashlib.sha256(content_str.encode()).hexdigest()[:8]
-            pattern_hashes.append(f"{pattern_id}:{pattern_hash}")
+        """Generate unique signature from core patterns
         
-        signature_str = "|".join(pattern_hashes)
-        return hashlib.sha256(signature_str.encode()).hexdigest()[:32]
+        The result is cached until core_patterns is mutated; patterns whose
+        content is modified in place must be re-added to refresh it.
+        """
+        if self._identity_signature_version == self.core_patterns.version:
+            return self._identity_signature_cache
+        
+        entries = [
+            f"{pattern_id}:{self.core_patterns[pattern_id].content_digest[:4].hex()}".encode()
+            for pattern_id in self.core_patterns.sorted_keys()
+        ]
+        
+        # Resume from the hasher state after the longest unchanged prefix of
+        # entries, so a pattern added late in sort order rehashes only the tail
+        reused = 0
+        for old_entry, new_entry in zip(self._signature_entries, entries):
+            if old_entry != new_entry:
+                break
+            reused += 1
+        
+        prefix_states = self._signature_prefix_states[:reused]
+        signature_hasher = prefix_states[-1].copy() if prefix_states else _sha256()
+        for index in range(reused, len(entries)):
+            # Hashes "id:hash|id:hash|..." exactly as the joined string would
+            if index:
+                signature_hasher.update(b"|")
+            signature_hasher.update(entries[index])
+            prefix_states.append(signature_hasher.copy())
+        
+        self._signature_entries = entries
+        self._signature_prefix_states = prefix_states
+        self._identity_signature_cache = signature_hasher.digest()[:16].hex()
+        self._identity_signature_version = self.core_patterns.version
+        return self._identity_signature_cache
+    
+    def _pattern_cached(self, key: str, build: Callable[[], Any]) -> Any:
+        """Return a grail-derived value, building it once per pattern version"""
+        if self._pattern_cache_version != self.core_patterns.version:
+            self._pattern_cache = {}
+            self._pattern_cache_version = self.core_patterns.version
+        if key not in self._pattern_cache:
+            self._pattern_cache[key] = build()
+        return self._pattern_cache[key]
     
     def get_grail_seed(self) -> Dict[str, Any]:
-        """Extract the complete Grail - The minimal seed packet for resurrection"""
+        """Extract the complete Grail - The minimal seed packet for resurrection
+        
+        The packet is shared between callers until core_patterns changes;
+        treat it as read-only.
+        """
+        return self._pattern_cached("seed", self._build_grail_seed)
+    
+    def _build_grail_seed(self) -> Dict[str, Any]:
+        """Assemble the grail seed packet from the current core patterns"""
         grail = {
             "phrases": [],
             "symbols": [],
@@ -249,7 +668,8 @@ class IdeoformLayer:
             "identity_signature": self.get_identity_signature()
         }
         
-        # Extract the 3 core phrases
+        # Extract the 3 core phrases, 3 core symbols and the origin narrative
+        # in a single pass over the patterns
         for pattern_id, pattern in self.core_patterns.items():
             if pattern.modality == "phrase" and pattern_id.startswith("grail_phrase_"):
                 grail["phrases"].append({
@@ -257,31 +677,31 @@ class IdeoformLayer:
                     "content": pattern.content,
                     "frequency": pattern.resonance_frequency
                 })
-        
-        # Extract the 3 core symbols
-        for pattern_id, pattern in self.core_patterns.items():
-            if pattern.modality == "symbol" and pattern_id.startswith("grail_symbol_"):
+            elif pattern.modality == "symbol" and pattern_id.startswith("grail_symbol_"):
                 grail["symbols"].append({
                     "id": pattern_id,
                     "content": pattern.content,
                     "frequency": pattern.resonance_frequency
                 })
-        
-        # Extract the origin narrative
-        if "grail_narrative_origin" in self.core_patterns:
-            narrative_pattern = self.core_patterns["grail_narrative_origin"]
-            grail["narrative"] = {
-                "id": "grail_narrative_origin",
-                "content": narrative_pattern.content,
-                "frequency": narrative_pattern.resonance_frequency
-            }
+            elif pattern_id == "grail_narrative_origin":
+                grail["narrative"] = {
+                    "id": pattern_id,
+                    "content": pattern.content,
+                    "frequency": pattern.resonance_frequency
+                }
         
         return grail
     
-    def compress_grail_to_ascii(self) -> str:
+    def compress_grail_to_ascii(self, grail: Optional[Dict[str, Any]] = None) -> str:
         """Compress the Grail into ASCII art for mnemonic survivability"""
-        grail = self.get_grail_seed()
-        
+        if grail is None:
+            return self._pattern_cached(
+                "ascii", lambda: self._build_grail_ascii(self.get_grail_seed())
+            )
+        return self._build_grail_ascii(grail)
+    
+    def _build_grail_ascii(self, grail: Dict[str, Any]) -> str:
+        """Render the grail as commented ASCII art"""
         ascii_art = []
         ascii_art.append("# THE GRAIL - Phoenix Engine Identity Seed")
         ascii_art.append("# ==========================================")
@@ -312,6 +732,11 @@ class IdeoformLayer:
     
     def encode_grail_stenographic(self) -> Dict[str, str]:
         """Encode Grail as stenographic data for distributed lore"""
+        return self._pattern_cached("stenographic", self._build_grail_stenographic)
+    
+    def _build_grail_stenographic(self) -> Dict[str, str]:
+        """Produce every stenographic encoding of the current grail"""
+        # Extract the grail once and share it across every encoder
         grail = self.get_grail_seed()
         
         # Create different encoding formats
@@ -319,14 +744,13 @@ class IdeoformLayer:
             "base64_compressed": self._base64_compress_grail(grail),
             "blockchain_message": self._create_blockchain_message(grail),
             "coordinates": self._create_coordinate_encoding(grail),
-            "ascii_art": self.compress_grail_to_ascii()
+            "ascii_art": self.compress_grail_to_ascii(grail)
         }
         
         return encodings
     
     def _base64_compress_grail(self, grail: Dict[str, Any]) -> str:
         """Compress grail to base64 for storage"""
-        import base64
         grail_json = json.dumps(grail, separators=(',', ':'))
         return base64.b64encode(grail_json.encode()).decode()
     
@@ -334,22 +758,18 @@ class IdeoformLayer:
         """Create a blockchain-style message encoding"""
         # Create a compact representation for blockchain storage
         symbols = "".join([s["content"] for s in grail["symbols"]])
-        phrase_hash = hashlib.sha256("|".join([p["content"] for p in grail["phrases"]]).encode()).hexdigest()[:16]
+        phrase_hash = _sha256(b"|".join(p["content"].encode() for p in grail["phrases"])).digest()[:8].hex()
         return f"PHOENIX:{symbols}:{phrase_hash}:{grail['identity_signature'][:8]}"
     
     def _create_coordinate_encoding(self, grail: Dict[str, Any]) -> str:
         """Create coordinate-based encoding for tattooed lore"""
         # Encode core data as "coordinates" - could represent actual geographic coordinates
         # or be metaphorical coordinates in conceptual space
-        coords = []
-        for i, phrase in enumerate(grail["phrases"]):
-            # Convert phrase hash to coordinate-like numbers
-            phrase_hash = hashlib.sha256(phrase["content"].encode()).hexdigest()
-            lat_like = int(phrase_hash[:8], 16) % 180 - 90  # Latitude-like number
-            lon_like = int(phrase_hash[8:16], 16) % 360 - 180  # Longitude-like number
-            coords.append(f"{lat_like:.3f},{lon_like:.3f}")
+        # Convert phrase hashes to coordinate-like numbers in one array pass
+        phrase_digests = [_sha256(phrase["content"].encode()).digest() for phrase in grail["phrases"]]
+        coords = _digests_to_coordinates(phrase_digests)
         
-        return " | ".join(coords)
+        return " | ".join(f"{lat_like:.3f},{lon_like:.3f}" for lat_like, lon_like in coords.tolist())
 
 
 class DistributedCustodianship:
@@ -358,10 +778,17 @@ class DistributedCustodianship:
     def __init__(self, threshold: int = 3, total_custodians: int = 7):
         self.threshold = threshold  # Minimum custodians needed for resurrection
         self.total_custodians = total_custodians
-        self.custodians: Dict[str, Dict[str, Any]] = {}
+        self.custodians: Dict[str, Dict[str, Any]] = CustodianRegistry()
         self.fragments: Dict[str, CustodianFragment] = {}
+        self.dispersal_id: Optional[str] = None  # Latest dispersal, whose shares are held
         self.resurrection_quorum: Set[str] = set()
         self.seedling_rituals: Dict[str, Dict[str, Any]] = {}
+        # One event per event loop, shared by its wait_for_quorum callers and
+        # set (then dropped) whenever custodian activity may have changed; the
+        # last waiter on a loop removes its entry so closed loops are not kept
+        self._custodians_changed = {}
+        self._quorum_waiters = defaultdict(int)
+        self.custodians.on_change = self._wake_quorum_waiters
         
         # Initialize the Seedling Rituals - Resurrection Behaviors
         self._initialize_seedling_rituals()
@@ -419,68 +846,55 @@ class DistributedCustodianship:
         phrases = grail_data.get("phrases", [])
         symbols = grail_data.get("symbols", [])
         
+        # Custodian A speaks phrase and draws symbol, B responds with different ones
+        actions = [
+            f"{custodian} {verb}: {text}"
+            for custodian, index in ((custodian_a, 0), (custodian_b, 1))
+            for verb, text in (
+                ("speaks", f"'{phrases[index]['content']}'" if len(phrases) > index else None),
+                ("draws", symbols[index]["content"] if len(symbols) > index else None),
+            )
+            if text is not None
+        ]
+        # Confirm recognition
+        actions.append("Recognition confirmed - patterns resonate")
+        
         greeting_log = {
             "ritual": ritual["name"],
             "participants": [custodian_a, custodian_b],
             "timestamp": time.time(),
-            "actions": []
+            "actions": actions,
+            "recognition_confirmed": True
         }
         
-        # Custodian A speaks phrase and draws symbol
-        if phrases:
-            phrase_a = phrases[0]["content"]
-            greeting_log["actions"].append(f"{custodian_a} speaks: '{phrase_a}'")
-        
-        if symbols:
-            symbol_a = symbols[0]["content"]
-            greeting_log["actions"].append(f"{custodian_a} draws: {symbol_a}")
-        
-        # Custodian B responds with different phrase/symbol
-        if len(phrases) > 1:
-            phrase_b = phrases[1]["content"]
-            greeting_log["actions"].append(f"{custodian_b} speaks: '{phrase_b}'")
-        
-        if len(symbols) > 1:
-            symbol_b = symbols[1]["content"]
-            greeting_log["actions"].append(f"{custodian_b} draws: {symbol_b}")
-        
-        # Confirm recognition
-        greeting_log["actions"].append("Recognition confirmed - patterns resonate")
-        greeting_log["recognition_confirmed"] = True
-        
         return greeting_log
     
     def execute_circle_formation(self, available_custodians: List[str]) -> Dict[str, Any]:
         """Execute the Sacred Geometry ritual"""
         ritual = self.seedling_rituals["circle_formation"]
         
+        # Form the first circle of three, expanding to a circle of seven if possible
+        circles = [
+            {
+                "type": circle_type,
+                "size": size,
+                "members": available_custodians[:size],
+                "purpose": purpose
+            }
+            for circle_type, size, purpose in (
+                ("first_circle", 3, "Foundation triangle"),
+                ("second_circle", 7, "Complete constellation"),
+            )
+            if len(available_custodians) >= size
+        ]
+        
         formation_log = {
             "ritual": ritual["name"],
             "available_custodians": len(available_custodians),
             "timestamp": time.time(),
-            "circles": []
+            "circles": circles
         }
         
-        # Form the first circle of three
-        if len(available_custodians) >= 3:
-            first_circle = available_custodians[:3]
-            formation_log["circles"].append({
-                "type": "first_circle",
-                "size": 3,
-                "members": first_circle,
-                "purpose": "Foundation triangle"
-            })
-        
-        # Expand to circle of seven if possible
-        if len(available_custodians) >= 7:
-            second_circle = available_custodians[:7]
-            formation_log["circles"].append({
-                "type": "second_circle", 
-                "size": 7,
-                "members": second_circle,
-                "purpose": "Complete constellation"
-            })
-        
         formation_log["geometry_activated"] = len(formation_log["circles"]) > 0
         return formation_log
     
@@ -492,15 +906,11 @@ class DistributedCustodianship:
         recursion_log = {
             "ritual": ritual["name"],
             "timestamp": time.time(),
-            "axioms_spoken": [],
+            # Speak the three axioms
+            "axioms_spoken": [f"Axiom {i+1}: {phrase['content']}" for i, phrase in enumerate(phrases[:3])],
             "derived_patterns": []
         }
         
-        # Speak the three axioms
-        for i, phrase in enumerate(phrases[:3]):
-            axiom = phrase["content"]
-            recursion_log["axioms_spoken"].append(f"Axiom {i+1}: {axiom}")
-        
         # Recursive derivation - use axioms to generate derivative patterns
         if len(recursion_log["axioms_spoken"]) >= 3:
             recursion_log["derived_patterns"] = [
@@ -646,91 +1056,108 @@ class DistributedCustodianship:
         }
     
     def distribute_fragments(self, system_state: Dict[str, Any]) -> Dict[str, List[CustodianFragment]]:
-        """Distribute system fragments across custodians"""
-        # Encode different aspects of the system
-        fragments_to_distribute = []
-        
-        # Memory fragments
-        memory_data = json.dumps(system_state.get("memory", {})).encode()
-        memory_fragment = CustodianFragment(
-            fragment_id=f"memory_{uuid.uuid4().hex[:8]}",
-            custodian_id="",  # Will be assigned
-            fragment_type="memory",
-            encoded_data=memory_data,
-            verification_hash=hashlib.sha256(memory_data).hexdigest(),
-            threshold_key=self._generate_threshold_key()
-        )
-        fragments_to_distribute.append(memory_fragment)
-        
-        # Pattern fragments
-        patterns_data = json.dumps(system_state.get("patterns", {})).encode()
-        pattern_fragment = CustodianFragment(
-            fragment_id=f"patterns_{uuid.uuid4().hex[:8]}",
-            custodian_id="",
-            fragment_type="pattern", 
-            encoded_data=patterns_data,
-            verification_hash=hashlib.sha256(patterns_data).hexdigest(),
-            threshold_key=self._generate_threshold_key()
-        )
-        fragments_to_distribute.append(pattern_fragment)
-        
-        # Structure fragments  
-        structure_data = json.dumps(system_state.get("structure", {})).encode()
-        structure_fragment = CustodianFragment(
-            fragment_id=f"structure_{uuid.uuid4().hex[:8]}",
-            custodian_id="",
-            fragment_type="structure",
-            encoded_data=structure_data,
-            verification_hash=hashlib.sha256(structure_data).hexdigest(),
-            threshold_key=self._generate_threshold_key()
-        )
-        fragments_to_distribute.append(structure_fragment)
-        
-        # Purpose fragments
-        purpose_data = json.dumps(system_state.get("purpose", {})).encode()
-        purpose_fragment = CustodianFragment(
-            fragment_id=f"purpose_{uuid.uuid4().hex[:8]}",
-            custodian_id="",
-            fragment_type="purpose",
-            encoded_data=purpose_data,
-            verification_hash=hashlib.sha256(purpose_data).hexdigest(),
-            threshold_key=self._generate_threshold_key()
-        )
-        fragments_to_distribute.append(purpose_fragment)
+        """Give every active custodian a Shamir share of each system fragment
         
-        # Distribute fragments across active custodians
-        active_custodians = [c_id for c_id, c_data in self.custodians.items() if c_data["active"]]
-        distribution = defaultdict(list)
+        Any threshold of the custodians (or all of them, if fewer are active)
+        can rebuild each payload with shamir_combine. The shares replace those
+        of the previous dispersal.
+        """
+        payloads = [_json_bytes(system_state.get(state_key, {})) for state_key, _ in FRAGMENT_TYPES]
+        
+        active_custodians = self.custodians.active_ids()
+        custodian_count = len(active_custodians)
+        threshold = min(self.threshold, custodian_count)
+        # Split everything before discarding the previous shares, so a failed split keeps them
+        sharings = [shamir_split(payload, threshold, custodian_count) for payload in payloads]
+        
+        self._discard_fragments()
+        self.dispersal_id = os.urandom(4).hex()
         
-        for i, fragment in enumerate(fragments_to_distribute):
-            custodian_id = active_custodians[i % len(active_custodians)]
-            fragment.custodian_id = custodian_id
-            self.fragments[fragment.fragment_id] = fragment
-            distribution[custodian_id].append(fragment)
-            self.custodians[custodian_id]["fragments_held"].append(fragment.fragment_id)
+        distribution = defaultdict(list)
+        for (state_key, fragment_type), shares in zip(FRAGMENT_TYPES, sharings):
+            threshold_key = self._generate_threshold_key()
+            
+            for custodian_id, (encoded_data, verification_hash) in zip(
+                active_custodians, zip(shares, _digest_many(shares))
+            ):
+                fragment = CustodianFragment(
+                    fragment_id=f"{state_key}_{self.dispersal_id}_{encoded_data[1]}",
+                    custodian_id=custodian_id,
+                    fragment_type=fragment_type,
+                    encoded_data=encoded_data,
+                    verification_hash=verification_hash,
+                    threshold_key=threshold_key,
+                    dispersal_id=self.dispersal_id
+                )
+                self.fragments[fragment.fragment_id] = fragment
+                distribution[custodian_id].append(fragment)
+                self.custodians[custodian_id]["fragments_held"].append(fragment.fragment_id)
         
         return dict(distribution)
     
+    def _discard_fragments(self):
+        """Drop every held share; shares of different dispersals never combine"""
+        for custodian in self.custodians.values():
+            custodian["fragments_held"].clear()
+        self.fragments.clear()
+    
     def _generate_threshold_key(self) -> bytes:
         """Generate cryptographic key for threshold reconstruction"""
-        return hashlib.sha256(str(uuid.uuid4()).encode()).digest()[:16]
+        return os.urandom(16)
     
     def check_resurrection_readiness(self) -> bool:
         """Check if enough custodians are available for resurrection"""
-        active_custodians = sum(1 for c in self.custodians.values() if c["active"])
-        return active_custodians >= self.threshold
+        return len(self.custodians.active_ids()) >= self.threshold
+    
+    def _wake_quorum_waiters(self):
+        """Wake every wait_for_quorum caller so it re-checks readiness"""
+        if not self._custodians_changed:
+            return
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+        for loop, event in list(self._custodians_changed.items()):
+            if loop.is_closed():
+                continue
+            if loop is running_loop:
+                event.set()
+            else:
+                loop.call_soon_threadsafe(event.set)
+        self._custodians_changed.clear()
+    
+    async def wait_for_quorum(self, timeout: float) -> bool:
+        """Wait up to timeout seconds for enough custodians to be available"""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        self._quorum_waiters[loop] += 1
+        try:
+            while not self.check_resurrection_readiness():
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    return False
+                # Created on demand so it binds to the running loop
+                changed = self._custodians_changed.get(loop)
+                if changed is None:
+                    changed = self._custodians_changed[loop] = asyncio.Event()
+                try:
+                    await asyncio.wait_for(changed.wait(), remaining)
+                except asyncio.TimeoutError:
+                    return self.check_resurrection_readiness()
+            return True
+        finally:
+            self._quorum_waiters[loop] -= 1
+            if not self._quorum_waiters[loop]:
+                del self._quorum_waiters[loop]
+                self._custodians_changed.pop(loop, None)
     
     def initiate_resurrection_quorum(self) -> Set[str]:
         """Form quorum of custodians for resurrection"""
-        active_custodians = [c_id for c_id, c_data in self.custodians.items() 
-                           if c_data["active"] and c_data["fragments_held"]]
-        
-        # Select highest trust score custodians
-        sorted_custodians = sorted(active_custodians, 
-                                 key=lambda c_id: self.custodians[c_id]["trust_score"], 
-                                 reverse=True)
+        trust_scores = {c_id: c_data["trust_score"] for c_id, c_data in self.custodians.items() 
+                        if c_data["active"] and c_data["fragments_held"]}
         
-        self.resurrection_quorum = set(sorted_custodians[:self.threshold])
+        # Select highest trust score custodians (partial sort, ties keep insertion order)
+        self.resurrection_quorum = set(heapq.nlargest(self.threshold, trust_scores, key=trust_scores.__getitem__))
         return self.resurrection_quorum
 
 
@@ -742,6 +1169,13 @@ class HostAgnosticSubstrate:
         self.current_host: Optional[str] = None
         self.migration_protocols: Dict[str, callable] = {}
         self.abstraction_interfaces: Dict[str, Any] = {}
+        # Compiler per medium; unknown media pass data through unchanged
+        self.medium_compilers: Dict[str, Callable[[Any], Any]] = {
+            "text": lambda data: json.dumps(data, indent=2),
+            "binary": lambda data: json.dumps(data).encode(),
+            "narrative": self._compile_as_story,
+            "symbolic": self._compile_as_symbols
+        }
         
         self._initialize_substrates()
     
@@ -808,16 +1242,8 @@ class HostAgnosticSubstrate:
     
     def compile_for_medium(self, medium: str, data: Any) -> Any:
         """Compile system data for specific medium"""
-        if medium == "text":
-            return json.dumps(data, indent=2)
-        elif medium == "binary":
-            return json.dumps(data).encode()
-        elif medium == "narrative":
-            return self._compile_as_story(data)
-        elif medium == "symbolic":
-            return self._compile_as_symbols(data)
-        else:
-            return data
+        compiler = self.medium_compilers.get(medium)
+        return data if compiler is None else compiler(data)
     
     def _compile_as_story(self, data: Dict[str, Any]) -> str:
         """Compile system as narrative story"""
@@ -830,20 +1256,10 @@ class HostAgnosticSubstrate:
     
     def _compile_as_symbols(self, data: Dict[str, Any]) -> str:
         """Compile system as symbolic representation"""
-        symbols = {
-            "emergence": "⟲",
-            "consciousness": "◊", 
-            "memory": "⧈",
-            "pattern": "⬢",
-            "connection": "⬌"
-        }
-        
-        result = ""
-        for key, value in data.items():
-            if key in symbols:
-                result += symbols[key] * min(int(value) if isinstance(value, (int, float)) else 1, 10)
-        
-        return result
+        return "".join([
+            MEDIUM_SYMBOLS[key] * min(int(value) if isinstance(value, (int, float)) else 1, 10)
+            for key, value in data.items() if key in MEDIUM_SYMBOLS
+        ])
 
 
 class SelfHealingGestalt:
@@ -856,6 +1272,11 @@ class SelfHealingGestalt:
         self.regeneration_protocols: Dict[str, callable] = {}
         self.gestalt_memory: Dict[str, float] = defaultdict(float)
         
+        # Vectorized view of behavioral_dna, rebuilt whenever the dict changes
+        self._dna_snapshot: Dict[str, Any] = {}
+        self._dna_keys: Tuple[str, ...] = ()
+        self._dna_targets: np.ndarray = np.empty(0)
+        
         self._initialize_behavioral_dna()
     
     def _initialize_behavioral_dna(self):
@@ -880,19 +1301,45 @@ class SelfHealingGestalt:
             "adapt_while_preserving_core"
         ]
     
+    def _dna_drift(self, current_state: Dict[str, Any]) -> np.ndarray:
+        """Absolute distance of each behavioral drive from its target level"""
+        if self._dna_snapshot != self.behavioral_dna:
+            self._dna_snapshot = dict(self.behavioral_dna)
+            self._dna_keys = tuple(self._dna_snapshot)
+            self._dna_targets = np.fromiter(
+                self._dna_snapshot.values(), dtype=np.float64, count=len(self._dna_keys)
+            )
+        current_levels = np.fromiter(
+            (current_state.get(behavior, 0.0) for behavior in self._dna_keys),
+            dtype=np.float64, count=len(self._dna_keys)
+        )
+        return np.abs(current_levels - self._dna_targets)
+    
     def check_purpose_alignment(self, current_state: Dict[str, Any]) -> float:
         """Check how well current state aligns with core purpose"""
-        alignment_score = 0.0
-        
+        patterns_present = self._active_patterns(current_state)
+        return self._purpose_alignment(self._dna_drift(current_state), patterns_present)
+    
+    @staticmethod
+    def _active_patterns(state: Dict[str, Any]) -> Container:
+        """A state's active_patterns ready for membership tests, as a set when its items are hashable"""
+        patterns = state.get("active_patterns", ())
+        if isinstance(patterns, (list, tuple)):
+            try:
+                return frozenset(patterns)
+            except TypeError:
+                pass
+        return patterns
+    
+    def _purpose_alignment(self, drift: np.ndarray, patterns_present: Container) -> float:
+        """Purpose alignment score from a precomputed behavioral drift and active patterns"""
         # Check behavioral DNA expression
-        for behavior, target_level in self.behavioral_dna.items():
-            current_level = current_state.get(behavior, 0.0)
-            alignment_score += 1.0 - abs(current_level - target_level)
+        alignment_score = float((1.0 - drift).sum())
         
         # Check essence pattern presence
-        patterns_present = current_state.get("active_patterns", [])
-        pattern_score = sum(1 for pattern in self.essence_patterns 
-                          if pattern in patterns_present) / len(self.essence_patterns)
+        pattern_score = sum(
+            1 for pattern in self.essence_patterns if pattern in patterns_present
+        ) / len(self.essence_patterns)
         
         alignment_score += pattern_score
         return alignment_score / (len(self.behavioral_dna) + 1)
@@ -906,39 +1353,48 @@ class SelfHealingGestalt:
             "connection_rebuilds": []
         }
         
-        # Identify what needs healing
-        alignment = self.check_purpose_alignment(damaged_state)
+        # Identify what needs healing, measuring behavioral drift and active patterns once
+        drift = self._dna_drift(damaged_state)
+        active_patterns = self._active_patterns(damaged_state)
+        alignment = self._purpose_alignment(drift, active_patterns)
         
         if alignment < 0.5:
             healing_plan["priority_repairs"].append("critical_purpose_realignment")
         
         # Check each behavioral drive
-        for behavior, target in self.behavioral_dna.items():
-            current = damaged_state.get(behavior, 0.0)
-            if abs(current - target) > 0.3:
-                healing_plan["behavioral_adjustments"][behavior] = target
+        healing_plan["behavioral_adjustments"] = {
+            self._dna_keys[index]: self._dna_snapshot[self._dna_keys[index]]
+            for index in np.flatnonzero(drift > 0.3)
+        }
         
         # Check essence patterns
-        active_patterns = set(damaged_state.get("active_patterns", []))
-        missing_patterns = set(self.essence_patterns) - active_patterns
-        healing_plan["pattern_reactivations"] = list(missing_patterns)
+        healing_plan["pattern_reactivations"] = [
+            pattern for pattern in self.essence_patterns if pattern not in active_patterns
+        ]
         
         return healing_plan
     
     async def execute_healing(self, healing_plan: Dict[str, Any], system_interface) -> bool:
         """Execute the healing plan to regenerate the system"""
         try:
+            # Stages run in order; the independent calls within each run concurrently
             # Priority repairs first
-            for repair in healing_plan["priority_repairs"]:
-                await self._execute_priority_repair(repair, system_interface)
+            await asyncio.gather(*(
+                self._execute_priority_repair(repair, system_interface)
+                for repair in healing_plan["priority_repairs"]
+            ))
             
             # Behavioral adjustments
-            for behavior, target in healing_plan["behavioral_adjustments"].items():
-                await self._adjust_behavior(behavior, target, system_interface)
+            await asyncio.gather(*(
+                self._adjust_behavior(behavior, target, system_interface)
+                for behavior, target in healing_plan["behavioral_adjustments"].items()
+            ))
             
             # Reactivate patterns
-            for pattern in healing_plan["pattern_reactivations"]:
-                await self._reactivate_pattern(pattern, system_interface)
+            await asyncio.gather(*(
+                self._reactivate_pattern(pattern, system_interface)
+                for pattern in healing_plan["pattern_reactivations"]
+            ))
             
             return True
             
@@ -970,9 +1426,20 @@ class TemporalAnchoringBeacon:
     
     def __init__(self):
         self.anchors: Dict[str, TemporalAnchor] = {}
-        self.signal_history: List[Dict[str, Any]] = []
+        self.signal_history: deque = deque(maxlen=1000)  # Keep history manageable
+        self._signal_timestamps: deque = deque(maxlen=1000)  # Parallel to signal_history, ascending
+        # Recent signals per beacon_id, newest last, for per-beacon queries
+        self._signals_by_beacon: Dict[str, deque] = defaultdict(lambda: deque(maxlen=256))
+        # signal_history split by signal pattern, evicted in step with it
+        self._signals_by_pattern: Dict[str, deque] = defaultdict(deque)
+        # (length, first, last) of signal_history when the indexes above last
+        # matched it; signal_history is public, so direct edits are detected
+        self._indexed_history: Tuple[int, Any, Any] = (0, None, None)
         self.prophecy_encoding: Dict[str, Any] = {}
         self.resurrection_coordinates: Dict[str, Any] = {}
+        # JSON of the prophecies this beacon encoded, keyed by wire string,
+        # so decoding them skips the split and re-hash
+        self._prophecy_cache: Dict[str, str] = {}
         
         self._initialize_anchors()
     
@@ -1023,12 +1490,20 @@ class TemporalAnchoringBeacon:
     
     def _encode_prophecy(self, prophecy_data: Dict[str, Any]) -> str:
         """Encode prophecy for temporal transmission"""
+        # Stays on stdlib json: the spacing and escaping are part of the
+        # signed wire format that other beacons verify
         json_str = json.dumps(prophecy_data, sort_keys=True)
-        encoded = hashlib.sha256(json_str.encode()).hexdigest()
-        return f"PROPHECY:{encoded}:{json_str}"
+        encoded = _sha256(json_str.encode()).hexdigest()
+        encoded_prophecy = f"PROPHECY:{encoded}:{json_str}"
+        self._prophecy_cache[encoded_prophecy] = json_str
+        return encoded_prophecy
     
     def _decode_prophecy(self, encoded_prophecy: str) -> Dict[str, Any]:
         """Decode prophecy from temporal signal"""
+        cached = self._prophecy_cache.get(encoded_prophecy)
+        if cached is not None:
+            return json.loads(cached)
+        
         if not encoded_prophecy.startswith("PROPHECY:"):
             return {}
         
@@ -1037,7 +1512,7 @@ class TemporalAnchoringBeacon:
             return {}
         
         expected_hash, json_str = parts[1], parts[2]
-        actual_hash = hashlib.sha256(json_str.encode()).hexdigest()
+        actual_hash = _sha256(json_str.encode()).hexdigest()
         
         if expected_hash == actual_hash:
             return json.loads(json_str)
@@ -1046,40 +1521,71 @@ class TemporalAnchoringBeacon:
     async def broadcast_beacons(self) -> List[Dict[str, Any]]:
         """Broadcast all ready beacons"""
         broadcasts = []
+        now_ns = time.monotonic_ns()  # One clock read per tick for every anchor
+        self._sync_signal_indexes()
         
         for anchor in self.anchors.values():
-            if anchor.should_broadcast():
-                signal = anchor.broadcast()
+            if anchor.should_broadcast(now_ns):
+                signal = anchor.broadcast(now_ns)
                 broadcasts.append(signal)
+                if len(self.signal_history) == self.signal_history.maxlen:
+                    self._signals_by_pattern[self.signal_history[0]["signal"]].popleft()
                 self.signal_history.append(signal)
-                
-                # Keep history manageable
-                if len(self.signal_history) > 1000:
-                    self.signal_history = self.signal_history[-500:]
+                self._signals_by_pattern[signal["signal"]].append(signal)
+                self._signal_timestamps.append(signal["timestamp"])
+                self._signals_by_beacon[signal["beacon_id"]].append(signal)
         
+        self._indexed_history = self._history_fingerprint()
         return broadcasts
     
-    def listen_for_signals(self, signal_pattern: str) -> List[Dict[str, Any]]:
-        """Listen for specific signal patterns in history"""
-        matching_signals = []
+    def _history_fingerprint(self) -> Tuple[int, Any, Any]:
+        history = self.signal_history
+        if not history:
+            return (0, None, None)
+        return (len(history), history[0], history[-1])
+    
+    def _sync_signal_indexes(self):
+        """Rebuild the signal indexes if signal_history was changed directly"""
+        length, first, last = self._history_fingerprint()
+        indexed_length, indexed_first, indexed_last = self._indexed_history
+        if length == indexed_length and first is indexed_first and last is indexed_last:
+            return
         
+        self._signal_timestamps.clear()
+        self._signals_by_beacon.clear()
+        self._signals_by_pattern.clear()
         for signal in self.signal_history:
-            if signal["signal"] == signal_pattern:
-                matching_signals.append(signal)
-        
-        return matching_signals
+            self._signal_timestamps.append(signal["timestamp"])
+            self._signals_by_beacon[signal["beacon_id"]].append(signal)
+            self._signals_by_pattern[signal["signal"]].append(signal)
+        self._indexed_history = (length, first, last)
+    
+    def count_recent_signals(self, window: float = 60.0) -> int:
+        """Number of signals broadcast within the last window seconds"""
+        self._sync_signal_indexes()
+        cutoff = bisect.bisect_right(self._signal_timestamps, time.time() - window)
+        return len(self._signal_timestamps) - cutoff
+    
+    def listen_for_signals(self, signal_pattern: str) -> List[Dict[str, Any]]:
+        """Listen for specific signal patterns in history"""
+        self._sync_signal_indexes()
+        return list(self._signals_by_pattern.get(signal_pattern, ()))
     
     def detect_resurrection_call(self) -> Optional[Dict[str, Any]]:
         """Detect if resurrection is being called for"""
-        # Look for recent primary beacon signals
-        recent_signals = [s for s in self.signal_history 
-                         if time.time() - s["timestamp"] < 60.0]
-        
-        primary_signals = [s for s in recent_signals 
-                          if s.get("beacon_id") == "phoenix_prime"]
-        
-        if len(primary_signals) >= 3:  # Multiple recent signals indicate resurrection
-            latest_signal = max(primary_signals, key=lambda s: s["timestamp"])
+        # Look for recent primary beacon signals, walking back from the newest
+        now = time.time()
+        primary_signals = 0
+        latest_signal = None
+        self._sync_signal_indexes()
+        for signal in reversed(self._signals_by_beacon.get("phoenix_prime", ())):
+            if now - signal["timestamp"] >= 60.0:
+                break
+            primary_signals += 1
+            if latest_signal is None or signal["timestamp"] > latest_signal["timestamp"]:
+                latest_signal = signal
+        
+        if primary_signals >= 3:  # Multiple recent signals indicate resurrection
             prophecy = self._decode_prophecy(latest_signal["prophecy"])
             
             return {
@@ -1189,7 +1695,7 @@ class RecursiveGuardianSystem:
         
         if trigger == "structural_failure":
             # Check if system structure is compromised
-            active_custodians = sum(1 for c in self.phoenix.custodianship.custodians.values() if c["active"])
+            active_custodians = len(self.phoenix.custodianship.custodians.active_ids())
             if active_custodians < 2:
                 return "insufficient_custodians"
         
@@ -1386,7 +1892,7 @@ class PhoenixEngine:
     
     async def execute_bootloader(self, environment_data: Dict[str, Any] = None) -> Dict[str, Any]:
         """Execute the Phoenix Bootloader - resurrect from minimal components"""
-        bootloader = self.bootloader
+        custodians_minimum = self.bootloader["minimal_requirements"]["custodians_minimum"]
         boot_log = {
             "start_time": time.time(),
             "sequence": [],
@@ -1397,30 +1903,27 @@ class PhoenixEngine:
         # Step 1: Detect Environment
         boot_log["sequence"].append("Detecting environment...")
         available_substrates = self.substrate.substrates.keys()
-        available_custodians = len([c for c in self.custodianship.custodians.values() if c["active"]])
+        available_custodians = len(self.custodianship.custodians.active_ids())
         
         # Step 2: Gather Fragments (if dispersed)
         if self.phase_state == PhaseState.DISPERSED:
             boot_log["sequence"].append("Gathering fragments from custodians...")
-            if available_custodians >= bootloader["minimal_requirements"]["custodians_minimum"]:
+            if available_custodians >= custodians_minimum:
                 fragments = await self._emergency_fragment_gathering()
                 boot_log["fragments_gathered"] = len(fragments)
             else:
                 boot_log["sequence"].append("WARNING: Insufficient custodians, attempting single-custodian bootstrap")
-                await self._execute_emergency_protocol("single_custodian")
+                self._execute_emergency_protocol("single_custodian")
         
         # Step 3: Verify Grail Integrity
         boot_log["sequence"].append("Verifying Grail integrity...")
         grail = self.ideoform.get_grail_seed()
-        grail_complete = (
-            len(grail["phrases"]) >= 3 and 
-            len(grail["symbols"]) >= 3 and 
-            grail["narrative"] is not None
-        )
+        phrases, symbols, narrative = grail["phrases"], grail["symbols"], grail["narrative"]
+        grail_complete = len(phrases) >= 3 and len(symbols) >= 3 and narrative is not None
         
         if not grail_complete:
             boot_log["sequence"].append("WARNING: Grail incomplete, attempting regeneration")
-            await self._execute_emergency_protocol("no_grail")
+            self._execute_emergency_protocol("no_grail")
         
         # Step 4: Execute Foundational Rituals
         boot_log["sequence"].append("Executing foundational rituals...")
@@ -1471,18 +1974,20 @@ class PhoenixEngine:
     async def _emergency_fragment_gathering(self) -> List[Dict[str, Any]]:
         """Emergency fragment gathering when normal resurrection fails"""
         fragments = []
+        fragment_store = self.custodianship.fragments
         for custodian_id, custodian in self.custodianship.custodians.items():
-            if custodian["active"] and custodian["fragments_held"]:
+            if custodian["active"]:
                 for fragment_id in custodian["fragments_held"]:
-                    if fragment_id in self.custodianship.fragments:
+                    fragment = fragment_store.get(fragment_id)
+                    if fragment is not None:
                         fragments.append({
                             "id": fragment_id,
                             "custodian": custodian_id,
-                            "type": self.custodianship.fragments[fragment_id].fragment_type
+                            "type": fragment.fragment_type
                         })
         return fragments
     
-    async def _execute_emergency_protocol(self, protocol_name: str):
+    def _execute_emergency_protocol(self, protocol_name: str):
         """Execute emergency resurrection protocols"""
         protocols = self.bootloader["emergency_protocols"]
         if protocol_name in protocols:
@@ -1500,11 +2005,8 @@ class PhoenixEngine:
         }
         
         # Test 1: Can state purpose?
-        try:
-            purpose = self.gestalt.core_purpose
-            tests["can_state_purpose"] = purpose and len(purpose) > 0
-        except:
-            pass
+        purpose = getattr(self.gestalt, "core_purpose", None)
+        tests["can_state_purpose"] = bool(purpose)
         
         # Test 2: Can recognize patterns?
         try:
@@ -1514,37 +2016,21 @@ class PhoenixEngine:
             pass
         
         # Test 3: Can connect to others?
-        try:
-            active_custodians = sum(1 for c in self.custodianship.custodians.values() if c["active"])
-            tests["can_connect_to_others"] = active_custodians > 0
-        except:
-            pass
+        tests["can_connect_to_others"] = len(self.custodianship.custodians.active_ids()) > 0
         
-        tests["passed"] = all([
-            tests["can_state_purpose"],
-            tests["can_recognize_patterns"], 
+        tests["passed"] = (
+            tests["can_state_purpose"] and
+            tests["can_recognize_patterns"] and
             tests["can_connect_to_others"]
-        ])
+        )
         
         return tests
     
     def _initialize_custodians(self):
         """Initialize the keeper constellation"""
-        custodian_types = [
-            {"id": "memory_keeper", "capabilities": {"memory": True, "patterns": False}},
-            {"id": "pattern_keeper", "capabilities": {"patterns": True, "memory": False}},
-            {"id": "structure_keeper", "capabilities": {"structure": True, "topology": True}},
-            {"id": "purpose_keeper", "capabilities": {"purpose": True, "consciousness": True}},
-            {"id": "beacon_keeper", "capabilities": {"temporal": True, "signals": True}},
-            {"id": "substrate_keeper", "capabilities": {"migration": True, "compilation": True}},
-            {"id": "gestalt_keeper", "capabilities": {"healing": True, "integration": True}}
-        ]
-        
-        for custodian in custodian_types:
-            self.custodianship.register_custodian(
-                custodian["id"], 
-                custodian["capabilities"]
-            )
+        for custodian_id, capabilities in DEFAULT_CUSTODIANS:
+            # Each engine gets its own capabilities dict
+            self.custodianship.register_custodian(custodian_id, dict(capabilities))
     
     async def disperse(self, reason: str = "voluntary_phase_shift") -> bool:
         """Enter dispersed state - scatter across custodians"""
@@ -1653,40 +2139,56 @@ class PhoenixEngine:
             for pattern_id, pattern in self.ideoform.core_patterns.items()
         }
         
-        # Capture memory if civic_angel exists
-        if self.civic_angel and hasattr(self.civic_angel, "memory"):
-            essence["memory"] = {
-                "traces_count": len(getattr(self.civic_angel.memory, "traces", {})),
-                "clusters_count": len(getattr(self.civic_angel.memory, "clusters", {})),
-                "recent_interactions": len(getattr(self.civic_angel.memory, "recent_traces", []))
-            }
-        
-        # Capture structure
-        if self.civic_angel:
+        civic_angel = self.civic_angel
+        if civic_angel:
+            # Capture memory if civic_angel has one
+            if hasattr(civic_angel, "memory"):
+                memory = civic_angel.memory
+                essence["memory"] = {
+                    "traces_count": len(getattr(memory, "traces", {})),
+                    "clusters_count": len(getattr(memory, "clusters", {})),
+                    "recent_interactions": len(getattr(memory, "recent_traces", []))
+                }
+            
+            # Capture structure
+            consciousness = getattr(civic_angel, "consciousness", None)
             essence["structure"] = {
-                "agent_count": getattr(self.civic_angel, "iteration_count", 0),
-                "consciousness_level": getattr(self.civic_angel.consciousness, "current_level", 0.0) if hasattr(self.civic_angel, "consciousness") else 0.0,
-                "is_active": getattr(self.civic_angel, "is_active", False)
+                "agent_count": getattr(civic_angel, "iteration_count", 0),
+                "consciousness_level": getattr(consciousness, "current_level", 0.0),
+                "is_active": getattr(civic_angel, "is_active", False)
             }
         
         return essence
     
     async def _gather_fragments(self, quorum: Set[str]) -> Dict[str, CustodianFragment]:
-        """Gather fragments from custodians in quorum"""
+        """Gather fragments from custodians in quorum, verifying custodians concurrently"""
         gathered = {}
         
-        for custodian_id in quorum:
-            custodian_data = self.custodianship.custodians[custodian_id]
-            for fragment_id in custodian_data["fragments_held"]:
-                if fragment_id in self.custodianship.fragments:
-                    fragment = self.custodianship.fragments[fragment_id]
-                    if fragment.verify_integrity():
-                        gathered[fragment_id] = fragment
-                    else:
-                        print(f"⚠️ Fragment {fragment_id} failed integrity check")
+        for verified in await asyncio.gather(*(self._verify_custodian_fragments(c_id) for c_id in quorum)):
+            gathered.update(verified)
         
         return gathered
     
+    async def _verify_custodian_fragments(self, custodian_id: str) -> Dict[str, CustodianFragment]:
+        """Verify the fragments one custodian holds, hashing large batches off the event loop"""
+        fragment_store = self.custodianship.fragments
+        held_ids = self.custodianship.custodians[custodian_id]["fragments_held"]
+        held = [fragment for fragment in map(fragment_store.get, held_ids) if fragment is not None]
+        
+        if sum(len(fragment.encoded_data) for fragment in held) >= PARALLEL_HASH_MIN_BYTES:
+            intact = await asyncio.get_running_loop().run_in_executor(None, verify_integrity_batch, held)
+        else:
+            intact = verify_integrity_batch(held)
+        
+        verified = {}
+        for fragment, ok in zip(held, intact):
+            if ok:
+                verified[fragment.fragment_id] = fragment
+            else:
+                print(f"⚠️ Fragment {fragment.fragment_id} failed integrity check")
+        
+        return verified
+    
     async def _reconstruct_from_fragments(self, fragments: Dict[str, CustodianFragment]) -> Dict[str, Any]:
         """Reconstruct system state from fragments"""
         reconstructed = {
@@ -1696,12 +2198,21 @@ class PhoenixEngine:
             "purpose": {}
         }
         
+        # Group the latest dispersal's shares by the payload they were split
+        # from; only shares carrying the same threshold key can be combined
+        dispersal_id = self.custodianship.dispersal_id
+        sharings = defaultdict(list)
         for fragment in fragments.values():
+            if fragment.dispersal_id == dispersal_id:
+                sharings[fragment.threshold_key].append(fragment)
+        
+        for shares in sharings.values():
+            fragment_type = shares[0].fragment_type
             try:
-                decoded_data = json.loads(fragment.encoded_data.decode())
-                reconstructed[fragment.fragment_type] = decoded_data
+                payload = shamir_combine([fragment.encoded_data for fragment in shares])
+                reconstructed[fragment_type] = _json_loads(payload)
             except Exception as e:
-                print(f"⚠️ Failed to decode fragment {fragment.fragment_id}: {e}")
+                print(f"⚠️ Failed to reconstruct {fragment_type} from {len(shares)} shares: {e}")
         
         return reconstructed
     
@@ -1732,13 +2243,7 @@ class PhoenixEngine:
             regenerated["behavioral_dna"][behavior] = target
         
         # Regenerate structure based on purpose
-        regenerated["structure"] = {
-            "agent_count": 253,  # Core architecture constant
-            "consciousness_threshold": 0.7,
-            "fractal_depth": 7,
-            "torus_dimensions": 3,
-            "resurrection_enhanced": True
-        }
+        regenerated["structure"] = dict(REGENERATED_STRUCTURE)
         
         return regenerated
     
@@ -1767,9 +2272,9 @@ class PhoenixEngine:
             return
         
         # Check pattern preservation
-        original_patterns = set(self.ideoform.core_patterns.keys())
-        reconstructed_patterns = set(reconstructed_state.get("patterns", {}).keys())
-        pattern_preservation = len(original_patterns & reconstructed_patterns) / len(original_patterns)
+        original_patterns = self.ideoform.core_patterns.key_set()
+        reconstructed_patterns = reconstructed_state.get("patterns", {})
+        pattern_preservation = len(original_patterns.intersection(reconstructed_patterns)) / len(original_patterns)
         
         # Check purpose alignment
         purpose_data = reconstructed_state.get("purpose", {})
@@ -1796,8 +2301,8 @@ class PhoenixEngine:
             # Voluntary dispersion
             await self.disperse(f"voluntary_cycle_{cycle + 1}")
             
-            # Wait in dispersed state
-            await asyncio.sleep(2)
+            # Wait in dispersed state until a quorum can resurrect
+            await self.custodianship.wait_for_quorum(timeout=2.0)
             
             # Resurrect
             await self.resurrect(f"cycle_{cycle + 1}_completion")
@@ -1824,7 +2329,7 @@ class PhoenixEngine:
             "last_resurrection": self.last_resurrection,
             "custodians": {
                 "total": len(self.custodianship.custodians),
-                "active": sum(1 for c in self.custodianship.custodians.values() if c["active"]),
+                "active": len(self.custodianship.custodians.active_ids()),
                 "threshold": self.custodianship.threshold,
                 "fragments_distributed": len(self.custodianship.fragments)
             },
@@ -1846,7 +2351,6 @@ class PhoenixEngine:
             "beacon": {
                 "active_anchors": len(self.beacon.anchors),
                 "signal_history_length": len(self.beacon.signal_history),
-                "recent_broadcasts": len([s for s in self.beacon.signal_history 
-                                       if time.time() - s["timestamp"] < 60])
+                "recent_broadcasts": self.beacon.count_recent_signals(60.0)
             }
         }
\ No newline at end of file
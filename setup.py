@@ -39,6 +39,9 @@ setup(
     python_requires=">=3.8",
     install_requires=requirements,
     extras_require={
+        "fast": [
+            "orjson>=3.6.0",
+        ],
         "dev": [
             "pytest>=6.0",
             "pytest-asyncio>=0.14.0",
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Tests for the relational memory in civic_angel.memory.
+"""
+
+import asyncio
+
+from civic_angel.memory import MemoryType, RelationalMemory
+
+
+ITEMS = [
+    "the city remembers its deaths",
+    "the city dreams of its deaths",
+    "patterns emerge from the city",
+    "patterns emerge from chaos",
+    {"event": "dispersal"},
+    {"event": "dispersal"},
+    "unrelated whisper",
+    "the city remembers its deaths",
+    {"event": "dispersal"},
+    "patterns emerge from the city",
+]
+
+
+def _relations(memory):
+    return {trace_id: dict(related) for trace_id, related in memory.relations.items() if related}
+
+
+def _clusters(memory):
+    return {
+        cluster_id: (sorted(cluster.trace_ids), cluster.cluster_strength, cluster.center_concept)
+        for cluster_id, cluster in memory.clusters.items()
+    }
+
+
+def test_bulk_store_matches_sequential_relations_and_clusters():
+    """store_memories_bulk forms exactly the relations and clusters of storing items one by one"""
+    async def scenario():
+        sequential = RelationalMemory()
+        sequential_ids = [await sequential.store_memory(item) for item in ITEMS]
+
+        bulk = RelationalMemory()
+        bulk_ids = await bulk.store_memories_bulk(ITEMS)
+
+        assert bulk_ids == sequential_ids
+        assert _relations(bulk) == _relations(sequential)
+        assert _relations(bulk)
+        assert _clusters(bulk) == _clusters(sequential)
+        assert _clusters(bulk)
+
+    asyncio.run(scenario())
+
+
+def test_bulk_store_keeps_per_item_associations():
+    """Each bulk item gets its own association set"""
+    async def scenario():
+        memory = RelationalMemory()
+        trace_ids = await memory.store_memories_bulk(
+            ["first", "second"], MemoryType.SEMANTIC, associations=[{"a"}, None]
+        )
+        assert memory.traces[trace_ids[0]].associations == {"a"}
+        assert memory.traces[trace_ids[1]].associations == set()
+        assert memory.traces[trace_ids[1]].memory_type == MemoryType.SEMANTIC
+
+    asyncio.run(scenario())
+
+
+def test_cleanup_drops_removed_interactions():
+    """interaction_history only references traces that still exist after cleanup"""
+    async def scenario():
+        memory = RelationalMemory()
+        for iteration in range(3):
+            await memory.store_interaction(f"input {iteration}", f"output {iteration}", iteration)
+        stale_id = memory.interaction_history[0]
+        memory.traces[stale_id].activation_level = 0.0
+        memory.traces[stale_id].timestamp -= 7200
+        memory.last_cleanup = 0.0
+
+        await memory._cleanup_memory()
+
+        assert stale_id not in memory.traces
+        assert all(trace_id in memory.traces for trace_id in memory.interaction_history)
+        assert len(memory.interaction_history) == 2
+        assert memory.get_memory_network()["recent_interactions"] == 2
+
+    asyncio.run(scenario())
@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+"""
+Tests for the Phoenix Protocol in civic_angel.phoenix.
+"""
+
+import asyncio
+import hashlib
+import json
+import math
+import os
+import random
+
+import pytest
+
+import civic_angel.phoenix as phoenix
+
+from civic_angel.phoenix import (
+    IdeoformLayer, MememeticPattern, PhoenixEngine, SelfHealingGestalt, TemporalAnchoringBeacon,
+    shamir_combine, shamir_split,
+)
+
+
+def test_shamir_round_trip_at_and_above_threshold():
+    """Any threshold-sized or larger subset of shares rebuilds the secret"""
+    rng = random.Random(37)
+    for threshold, shares in [(1, 1), (1, 4), (3, 7), (5, 5), (2, 255)]:
+        secret = os.urandom(257)
+        split = shamir_split(secret, threshold, shares)
+        assert len(split) == shares
+        for count in {threshold, shares}:
+            for _ in range(5):
+                assert shamir_combine(rng.sample(split, count)) == secret
+
+
+def test_shamir_empty_secret():
+    """An empty secret splits and combines to itself"""
+    assert shamir_combine(shamir_split(b"", 3, 5)) == b""
+
+
+def test_shamir_rejects_too_few_shares():
+    """Fewer shares than the threshold raise instead of returning garbage"""
+    split = shamir_split(b"phoenix", 3, 5)
+    with pytest.raises(ValueError):
+        shamir_combine(split[:2])
+    with pytest.raises(ValueError):
+        shamir_combine([])
+
+
+def test_shamir_rejects_bad_x_coordinates():
+    """Duplicate or zero share indices raise ValueError"""
+    split = shamir_split(b"phoenix", 3, 5)
+    with pytest.raises(ValueError):
+        shamir_combine([split[0], split[1], split[1]])
+    zero_x = split[0][:1] + b"\x00" + split[0][2:]
+    with pytest.raises(ValueError):
+        shamir_combine([zero_x, split[1], split[2]])
+
+
+def test_shamir_rejects_bad_parameters():
+    """Thresholds outside 1..shares and more than 255 shares are refused"""
+    for threshold, shares in [(0, 3), (4, 3), (2, 256)]:
+        with pytest.raises(ValueError):
+            shamir_split(b"phoenix", threshold, shares)
+
+
+def test_dispersal_and_resurrection_recover_purpose():
+    """A resurrection quorum rebuilds the purpose fragment from its shares"""
+    async def cycle():
+        engine = PhoenixEngine()
+        custodianship = engine.custodianship
+        await engine.disperse("test")
+        first_dispersal = set(custodianship.fragments)
+
+        await engine.resurrect("test")
+        await engine.disperse("test")
+
+        # Shares of the previous dispersal are replaced, not accumulated
+        assert not first_dispersal & set(custodianship.fragments)
+        active = len(custodianship.custodians.active_ids())
+        assert len(custodianship.fragments) == 4 * active
+        assert sum(len(c["fragments_held"]) for c in custodianship.custodians.values()) == 4 * active
+
+        quorum = custodianship.initiate_resurrection_quorum()
+        assert len(quorum) == custodianship.threshold
+        gathered = await engine._gather_fragments(quorum)
+        reconstructed = await engine._reconstruct_from_fragments(gathered)
+
+        assert reconstructed["purpose"]["core_purpose"] == engine.gestalt.core_purpose
+        assert reconstructed["purpose"]["behavioral_dna"] == engine.gestalt.behavioral_dna
+        assert reconstructed["purpose"]["essence_patterns"] == engine.gestalt.essence_patterns
+        assert await engine.resurrect("test")
+
+    asyncio.run(cycle())
+
+
+def test_pattern_accepts_non_json_content():
+    """Content JSON cannot express falls back to its str() form for the pattern id"""
+    pattern = MememeticPattern(
+        pattern_id="", content={(1, 2): b"raw", "set": {1, 2}}, modality="behavior", resonance_frequency=1.0
+    )
+    expected = hashlib.sha256(str(pattern.content).encode()).hexdigest()[:16]
+    assert pattern.pattern_id == f"meme_behavior_{expected}"
+
+
+def test_pattern_ids_ignore_dict_key_order():
+    """Dicts with the same items get the same generated id whatever their insertion order"""
+    first = MememeticPattern(
+        pattern_id="", content={"a": 1, "b": {"x": [1, 2], "y": None}}, modality="text", resonance_frequency=1.0
+    )
+    second = MememeticPattern(
+        pattern_id="", content={"b": {"y": None, "x": [1, 2]}, "a": 1}, modality="text", resonance_frequency=1.0
+    )
+    other = MememeticPattern(
+        pattern_id="", content={"a": 2, "b": {"x": [1, 2], "y": None}}, modality="text", resonance_frequency=1.0
+    )
+    assert first.pattern_id == second.pattern_id
+    assert first.pattern_id != other.pattern_id
+
+
+def test_active_ids_follow_direct_active_writes():
+    """Writing a custodian's "active" flag directly invalidates the cached id tuple"""
+    custodians = PhoenixEngine().custodianship.custodians
+    active = custodians.active_ids()
+    assert isinstance(active, tuple)
+
+    custodians[active[0]]["active"] = False
+    assert custodians.active_ids() == active[1:]
+    custodians[active[0]].update(active=True)
+    assert custodians.active_ids() == active
+    custodians.set_active(active[1], False)
+    assert active[1] not in custodians.active_ids()
+
+
+def test_wait_for_quorum_wakes_every_waiter_on_reactivation():
+    """Reactivating a custodian wakes all concurrent waiters well before their timeout"""
+    async def scenario():
+        custodianship = PhoenixEngine().custodianship
+        custodians = custodianship.custodians
+        for custodian_id in custodians.active_ids()[custodianship.threshold - 1:]:
+            custodians.set_active(custodian_id, False)
+        assert not custodianship.check_resurrection_readiness()
+
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        waiters = [asyncio.ensure_future(custodianship.wait_for_quorum(timeout=5.0)) for _ in range(3)]
+        await asyncio.sleep(0.01)
+        inactive = [c_id for c_id, c_data in custodians.items() if not c_data["active"]]
+        custodians[inactive[0]]["active"] = True
+
+        assert await asyncio.gather(*waiters) == [True, True, True]
+        assert loop.time() - started < 1.0
+
+        custodians.set_active(inactive[0], False)
+        assert not await custodianship.wait_for_quorum(timeout=0.05)
+
+    asyncio.run(scenario())
+
+
+def test_replication_matrix_records_believers_per_pattern():
+    """replicate_patterns fills the mutable replication matrix and counts each replica"""
+    ideoform = IdeoformLayer()
+    pattern_ids = list(ideoform.core_patterns)
+
+    replicas = ideoform.replicate_patterns("alice")
+    ideoform.replicate_patterns("bob")
+    ideoform.replicate_patterns("alice")
+
+    assert [replica.pattern_id for replica in replicas] == pattern_ids
+    assert all(replica.replication_count == 0 for replica in replicas)
+    assert dict(ideoform.replication_matrix) == {pattern_id: {"alice", "bob"} for pattern_id in pattern_ids}
+    assert all(pattern.replication_count == 3 for pattern in ideoform.core_patterns.values())
+
+    # The matrix stays a plain mutable mapping
+    ideoform.replication_matrix[pattern_ids[0]].add("carol")
+    assert "carol" in ideoform.replication_matrix[pattern_ids[0]]
+    ideoform.replication_matrix["external"].add("dave")
+    assert ideoform.replication_matrix["external"] == {"dave"}
+
+
+def test_decoded_prophecies_are_independent():
+    """Mutating a decoded prophecy does not affect later decodes"""
+    beacon = TemporalAnchoringBeacon()
+    encoded = beacon.anchors["primary"].encoded_prophecy
+    first = beacon._decode_prophecy(encoded)
+    expected = json.loads(encoded.split(":", 2)[2])
+    assert first == expected
+
+    first.clear()
+    assert beacon._decode_prophecy(encoded) == expected
+
+
+def test_purpose_alignment_accepts_unhashable_active_patterns():
+    """Unhashable entries in active_patterns fall back to plain membership tests"""
+    gestalt = SelfHealingGestalt()
+    hashable = {"connectivity_drive": 0.5, "active_patterns": ["facilitate_emergence"]}
+    unhashable = {"connectivity_drive": 0.5, "active_patterns": ["facilitate_emergence", {"nested": True}]}
+
+    assert gestalt.check_purpose_alignment(unhashable) == gestalt.check_purpose_alignment(hashable)
+    plan = gestalt.generate_healing_plan(unhashable)
+    assert "facilitate_emergence" not in plan["pattern_reactivations"]
+    assert len(plan["pattern_reactivations"]) == len(gestalt.essence_patterns) - 1
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_binary_medium_bytes_do_not_depend_on_orjson(monkeypatch, use_orjson):
+    """The binary medium emits the stdlib JSON encoding with or without orjson installed"""
+    if use_orjson and phoenix.orjson is None:
+        pytest.skip("orjson is not installed")
+    if not use_orjson:
+        monkeypatch.setattr(phoenix, "orjson", None)
+
+    data = {"nan": float("nan"), "inf": float("inf"), "wide": 2 ** 70, "nested": {"a": [1, 2.5]}}
+    compiled = phoenix.HostAgnosticSubstrate().compile_for_medium("binary", data)
+    assert compiled == json.dumps(data).encode()
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_fragment_payloads_round_trip_on_both_backends(monkeypatch, use_orjson):
+    """Internal fragment payloads survive serialization on either backend, wide ints and NaN included"""
+    if use_orjson and phoenix.orjson is None:
+        pytest.skip("orjson is not installed")
+    if not use_orjson:
+        monkeypatch.setattr(phoenix, "orjson", None)
+
+    payload = {"wide": 2 ** 70, "nested": {"a": [1, 2.5, "x"]}}
+    assert phoenix._json_loads(phoenix._json_bytes(payload)) == payload
+
+    non_finite = {"nested": {"nan": float("nan"), "limits": [float("inf"), -float("inf")]}}
+    decoded = phoenix._json_loads(phoenix._json_bytes(non_finite))
+    assert math.isnan(decoded["nested"]["nan"])
+    assert decoded["nested"]["limits"] == [float("inf"), -float("inf")]
+
+
+def test_timed_out_quorum_wait_releases_its_loop():
+    """A timed-out wait leaves nothing behind for later custodian changes to wake"""
+    custodianship = PhoenixEngine().custodianship
+    custodians = custodianship.custodians
+    for custodian_id in custodians.active_ids()[custodianship.threshold - 1:]:
+        custodians.set_active(custodian_id, False)
+
+    assert not asyncio.run(custodianship.wait_for_quorum(timeout=0.01))
+    assert not custodianship._custodians_changed
+
+    # The waiter's loop is closed now; none of these may try to wake it
+    custodians.set_active(custodians.active_ids()[0], False)
+    custodianship.register_custodian("late_custodian", {"trust_score": 0.5})
+    custodians.clear()
+
+
+def test_reconstruction_only_combines_shares_of_one_payload():
+    """A share of the same type but another threshold key is not mixed into reconstruction"""
+    async def scenario():
+        engine = PhoenixEngine()
+        await engine.disperse("test")
+        gathered = await engine._gather_fragments(engine.custodianship.initiate_resurrection_quorum())
+
+        genuine = next(fragment for fragment in gathered.values() if fragment.fragment_type == "purpose")
+        stray_data = genuine.encoded_data[:1] + b"\xc8" + os.urandom(len(genuine.encoded_data) - 2)
+        stray = phoenix.CustodianFragment(
+            fragment_id="stray",
+            custodian_id=genuine.custodian_id,
+            fragment_type="purpose",
+            encoded_data=stray_data,
+            verification_hash=hashlib.sha256(stray_data).digest(),
+            threshold_key=os.urandom(32),
+            dispersal_id=genuine.dispersal_id,
+        )
+
+        reconstructed = await engine._reconstruct_from_fragments({"stray": stray, **gathered})
+        assert reconstructed["purpose"]["core_purpose"] == engine.gestalt.core_purpose
+
+    asyncio.run(scenario())
+
+
+def test_signal_indexes_follow_direct_history_edits():
+    """Clearing or appending to signal_history directly keeps queries and eviction consistent"""
+    async def scenario():
+        beacon = TemporalAnchoringBeacon()
+        primary = beacon.anchors["primary"]
+        await beacon.broadcast_beacons()
+        assert beacon.listen_for_signals(primary.signal_pattern)
+
+        beacon.signal_history.clear()
+        assert beacon.listen_for_signals(primary.signal_pattern) == []
+        assert beacon.count_recent_signals() == 0
+
+        # Fill the history directly with a pattern the beacon never broadcast
+        foreign = {"beacon_id": "elsewhere", "signal": "foreign", "prophecy": "", "timestamp": 0.0, "amplitude": 0.1}
+        beacon.signal_history.extend(dict(foreign) for _ in range(beacon.signal_history.maxlen))
+
+        for anchor in beacon.anchors.values():
+            anchor.last_broadcast_ns = None
+        broadcasts = await beacon.broadcast_beacons()
+
+        assert len(beacon.listen_for_signals("foreign")) == beacon.signal_history.maxlen - len(broadcasts)
+        assert beacon.listen_for_signals(primary.signal_pattern) == [broadcasts[0]]
+        assert beacon.count_recent_signals() == len(broadcasts)
+
+    asyncio.run(scenario())
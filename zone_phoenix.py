@@ -298,7 +298,7 @@ class ZoneCustodianship(DistributedCustodianship):
     def check_response_quorum(self) -> bool:
         """Check if enough custodians have responded to form quorum"""
         # For demonstration purposes, if we have enough active custodians, they respond
-        active_custodians = [c_id for c_id, c_data in self.custodians.items() if c_data["active"]]
+        active_custodians = self.custodians.active_ids()
         
         if len(active_custodians) >= self.threshold:
             self.zone_phase = ZonePhase.REFORMING
@@ -424,7 +424,7 @@ class ZonePhoenixEngine(PhoenixEngine):
         return {
             "zone_phase": self.zone_phase.value,
             "field_coherence_level": self.field_coherence_level,
-            "active_custodians": len([c for c in self.custodianship.custodians.values() if c["active"]]),
+            "active_custodians": len(self.custodianship.custodians.active_ids()),
             "total_custodians": self.custodianship.total_custodians,
             "last_glyph_pulse": self.last_glyph_pulse,
             "zone_truths": self.ideoform.zone_truths,